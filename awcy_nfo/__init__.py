@@ -1,12 +1,19 @@
 # allow module import using: 'from awcy_nfo import ReadMe'
 from .readme import ReadMe  # noqa
 
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-    from importlib_metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError: # frozen app support doesnt work with importlib
-    __version__ = "0.1.1"
+def __getattr__(name):
+    # resolve '__version__' on first access, skipping the metadata scan on import
+    if name == "__version__":
+        try:
+            from importlib.metadata import version, PackageNotFoundError
+        except ImportError:
+            from importlib_metadata import version, PackageNotFoundError
+
+        try:
+            v = version(__name__)
+        except PackageNotFoundError:  # frozen app support doesnt work with importlib
+            v = "0.1.1"
+        globals()["__version__"] = v
+        return v
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
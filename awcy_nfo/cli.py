@@ -4,38 +4,47 @@ import click_logging
 
 from click_logging.core import ClickHandler
 
-from . import __version__
 from .helpers import (
     ColorFormatter,
     show_headers_option,
     show_styles_option,
     get_example_option,
     get_style_option,
+    version_option,
 )
 from .readme import ReadMe, app_name
 
 
-# when used as an app: default stream handler
 logger = logging.getLogger(__package__)
-# redirect err levels to stderr
-log_echo = {
-    "error": dict(err=True),
-    "exception": dict(err=True),
-    "critical": dict(err=True),
-}
-shndl = ClickHandler(echo_kwargs=log_echo)
-shndl.name = __package__ + "_stream"
-shndl.level = logging.DEBUG
-# stylize log levels for terminal display
-log_style = {
-    "debug": dict(fg="blue"),
-    "warning": dict(fg="yellow"),
-    "error": dict(fg="red", blink=False),
-    "exception": dict(fg="red", blink=False),
-    "critical": dict(fg="white", bg="red", blink=True),
-}
-shndl.formatter = ColorFormatter(style_kwargs=log_style)
-logger.addHandler(shndl)
+_stream_handler = None  # set by _configure_logging
+
+
+def _configure_logging():
+    # when used as an app: default stream handler
+    global _stream_handler
+    if _stream_handler is not None:
+        return _stream_handler  # already configured (repeat invocations)
+    # redirect err levels to stderr
+    log_echo = {
+        "error": dict(err=True),
+        "exception": dict(err=True),
+        "critical": dict(err=True),
+    }
+    shndl = ClickHandler(echo_kwargs=log_echo)
+    shndl.name = __package__ + "_stream"
+    shndl.level = logging.DEBUG
+    # stylize log levels for terminal display
+    log_style = {
+        "debug": dict(fg="blue"),
+        "warning": dict(fg="yellow"),
+        "error": dict(fg="red", blink=False),
+        "exception": dict(fg="red", blink=False),
+        "critical": dict(fg="white", bg="red", blink=True),
+    }
+    shndl.formatter = ColorFormatter(style_kwargs=log_style)
+    logger.addHandler(shndl)
+    _stream_handler = shndl
+    return shndl
 
 
 @click.command()
@@ -82,10 +91,12 @@ logger.addHandler(shndl)
 @show_styles_option()
 @get_example_option()
 @get_style_option()
-@click.version_option(version=__version__, prog_name=app_name)
+@version_option(prog_name=app_name)
 def create_readme(yamlfile, output, filename, header, style, log):
     """... Create AWCY? readme.txt using a .yaml template file ..."""
 
+    stream_handler = _configure_logging()
+
     # file logger verbosity defaults to 'info', can only be overriden by 'debug'
     file_log_verbosity = (
         logging.DEBUG if logger.level == logging.DEBUG else logging.INFO
@@ -94,10 +105,8 @@ def create_readme(yamlfile, output, filename, header, style, log):
     # Unfortunately logger level is reset by click_logger's 'simple_verbosity_option'.
     # This is retarded. Instead, set the logger level back to debug, and update the
     # stream handler's level with the users desired verbosity level.
-    for handler in logger.handlers:
-        if handler.get_name() == __package__ + "_stream":
-            handler.setLevel(logger.level)
-            logger.setLevel(logging.DEBUG)
+    stream_handler.setLevel(logger.level)
+    logger.setLevel(logging.DEBUG)
 
     # Preheat the oven....
     ReadMe(
@@ -1,44 +1,167 @@
-import io
 import os
 import click
-import shutil
 import logging
-import contextlib
+import functools
 
+from errno import EXDEV, ENOSYS, EINVAL
 from click.utils import format_filename
-from click import option, echo, format_filename
-from pkg_resources import resource_listdir
-from pathlib import Path
+from click import option, echo, echo_via_pager, format_filename
 
+try:
+    from importlib.resources import files, as_file
+except ImportError:
+    from importlib_resources import files, as_file
 
-def get_style_option(*param_decls, **kwargs):
-    """Add a ``--get-style`` option which creates a copy of a
-    style.yaml example file.
-    :param param_decls: One or more option names. Defaults to the single
-        value ``"--get-style"``.
+COPY_BUFSIZE = 1024 * 1024  # fallback copy buffer size (1 MiB)
+_DIVIDER = "-----------------------------------------------------------"
+# bundled files copied by --get-style/--get-example
+_STYLE_SRC = files(__package__).joinpath("styles/classic.yaml")
+_EXAMPLE_SRC = files(__package__).joinpath("docs/example.yaml")
+# bundled header directory displayed by --show-headers
+_HEADERS_DIR = files(__package__).joinpath("headers")
+
+
+def _fast_copy(src, dst):
+    """Copy the contents of file ``src`` to file ``dst``.
+
+    Attempts an in-kernel copy using ``os.copy_file_range`` (Linux >= 4.5),
+    which avoids copying data through userspace and allows reflinks on
+    copy-on-write filesystems. If unavailable or unsupported (e.g. across
+    filesystems, or by FUSE/NFS/sandboxed setups), falls back to a buffered
+    ``readinto`` loop.
+
+    Args:
+        src: source filepath.
+        dst: destination filepath (created or overwritten).
+    """
+
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        if hasattr(os, "copy_file_range") and _copy_range(fsrc, fdst):
+            return
+        buf = bytearray(COPY_BUFSIZE)
+        buf_view = memoryview(buf)
+        for n in iter(lambda: fsrc.readinto(buf), 0):
+            fdst.write(buf_view[:n])
+
+
+def _copy_range(fsrc, fdst):
+    # copy_file_range loop, False (files rewound) if the buffered copy should
+    # be used instead. like shutil, any error before the first copied byte
+    # means unsupported, later errors only if they are known 'unsupported' ones
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    try:
+        while True:
+            n = os.copy_file_range(infd, outfd, COPY_BUFSIZE)
+            if n == 0:
+                break
+            copied += n
+    except OSError as e:
+        if copied and e.errno not in (EXDEV, ENOSYS, EINVAL):
+            raise
+    else:
+        # done, unless a non-empty source copied nothing (silently unsupported)
+        if copied or os.fstat(infd).st_size == 0:
+            return True
+    # restart from the beginning, discarding any partial copy
+    fsrc.seek(0)
+    fdst.seek(0)
+    fdst.truncate()
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _list_resource(subdir):
+    # sorted filenames of a package resource directory (read once per process).
+    # a tuple, so callers cannot reorder or mutate the shared cached result.
+    return tuple(sorted(p.name for p in files(__package__).joinpath(subdir).iterdir()))
+
+
+@functools.lru_cache(maxsize=64)
+def load_resource(group, file):
+    """Read a bundled package resource file.
+
+    Results are cached per process, including misses, since the readme
+    header/style fallback chains re-request the same (invalid) names.
+
+    Args:
+        group: resource directory (e.g. 'headers', 'styles').
+        file: resource filename within the group.
+
+    Returns:
+        The file contents as bytes, or None if there is no such file.
+    """
+
+    try:
+        return files(__package__).joinpath(f"{group}/{file}").read_bytes()
+    except OSError:
+        return None
+
+
+def _format_header(name, text):
+    # display block for one header: filename, ascii art, and trailing divider
+    return "=> %s\n%s\n\n%s" % (format_filename(name), text, _DIVIDER)
+
+
+def _copy_style():
+    with as_file(_STYLE_SRC) as fp:
+        _fast_copy(fp, os.path.join(os.getcwd(), "classic_example.yaml"))
+
+
+def _copy_example():
+    with as_file(_EXAMPLE_SRC) as fp:
+        _fast_copy(fp, os.path.join(os.getcwd(), "example.yaml"))
+
+
+def _echo_styles():
+    echo(_DIVIDER)
+    for f in _list_resource("styles"):
+        echo(f)
+
+
+def _echo_headers():
+    def headers():
+        # read/format each header only when the pager asks for it
+        yield _DIVIDER
+        for f in _list_resource("headers"):
+            txt = _HEADERS_DIR.joinpath(f).read_text(encoding="utf-8")
+            yield "\n" + _format_header(f, txt)
+
+    echo_via_pager(headers())
+
+
+def _eager_option(action, param_decls, kwargs):
+    """Build an eager, valueless flag option which runs ``action``
+    and exits the program.
+    :param action: Callable taking no arguments, run when the flag is given.
+    :param param_decls: Option names passed to :func:`option`.
     :param kwargs: Extra arguments are passed to :func:`option`.
     """
 
     def callback(ctx, param, value):
         if not value or ctx.resilient_parsing:
             return
-        fp = __package__ + "/styles/classic.yaml"
-        cd = Path.cwd()
-        sp = cd.joinpath("classic_example.yaml")
-        shutil.copyfile(fp, sp)
+        action()
         ctx.exit()
 
-    if not param_decls:
-        param_decls = ("--get-style",)
-
     kwargs.setdefault("is_flag", True)
     kwargs.setdefault("expose_value", False)
     kwargs.setdefault("is_eager", True)
-    kwargs.setdefault("help", "Get a copy of an example style.yaml file and exit.")
     kwargs["callback"] = callback
     return option(*param_decls, **kwargs)
 
 
+def get_style_option(*param_decls, **kwargs):
+    """Add a ``--get-style`` option which creates a copy of a
+    style.yaml example file.
+    :param param_decls: One or more option names. Defaults to the single
+        value ``"--get-style"``.
+    :param kwargs: Extra arguments are passed to :func:`option`.
+    """
+    kwargs.setdefault("help", "Get a copy of an example style.yaml file and exit.")
+    return _eager_option(_copy_style, param_decls or ("--get-style",), kwargs)
+
+
 def get_example_option(*param_decls, **kwargs):
     """Add a ``--get-example`` option which creates a copy of a
     template.yaml example file.
@@ -46,25 +169,8 @@ def get_example_option(*param_decls, **kwargs):
         value ``"--get-example"``.
     :param kwargs: Extra arguments are passed to :func:`option`.
     """
-
-    def callback(ctx, param, value):
-        if not value or ctx.resilient_parsing:
-            return
-        fp = __package__ + "/docs/example.yaml"
-        cd = Path.cwd()
-        sp = cd.joinpath("example.yaml")
-        shutil.copyfile(fp, sp)
-        ctx.exit()
-
-    if not param_decls:
-        param_decls = ("--get-example",)
-
-    kwargs.setdefault("is_flag", True)
-    kwargs.setdefault("expose_value", False)
-    kwargs.setdefault("is_eager", True)
     kwargs.setdefault("help", "Get an example template.yaml file and exit.")
-    kwargs["callback"] = callback
-    return option(*param_decls, **kwargs)
+    return _eager_option(_copy_example, param_decls or ("--get-example",), kwargs)
 
 
 def show_styles_option(*param_decls, **kwargs):
@@ -74,25 +180,8 @@ def show_styles_option(*param_decls, **kwargs):
         value ``"--show-styles"``.
     :param kwargs: Extra arguments are passed to :func:`option`.
     """
-
-    def callback(ctx, param, value):
-        if not value or ctx.resilient_parsing:
-            return
-        echo("-----------------------------------------------------------")
-        fs = resource_listdir(__package__, "styles")
-        for f in fs:
-            echo(f)
-        ctx.exit()
-
-    if not param_decls:
-        param_decls = ("--show-styles",)
-
-    kwargs.setdefault("is_flag", True)
-    kwargs.setdefault("expose_value", False)
-    kwargs.setdefault("is_eager", True)
     kwargs.setdefault("help", "Show available styles and exit.")
-    kwargs["callback"] = callback
-    return option(*param_decls, **kwargs)
+    return _eager_option(_echo_styles, param_decls or ("--show-styles",), kwargs)
 
 
 def show_headers_option(*param_decls, **kwargs):
@@ -102,83 +191,67 @@ def show_headers_option(*param_decls, **kwargs):
         value ``"--show-headers"``.
     :param kwargs: Extra arguments are passed to :func:`option`.
     """
+    kwargs.setdefault("help", "Print all available headers and exit.")
+    return _eager_option(_echo_headers, param_decls or ("--show-headers",), kwargs)
 
-    def callback(ctx, param, value):
-        if not value or ctx.resilient_parsing:
-            return
-        fs = resource_listdir(__package__, "headers")
-        echo("-----------------------------------------------------------")
-        for f in fs:
-            fp = __package__ + "/headers/" + f
-            with io.open(fp,'r', encoding='utf-8') as ft:
-                echo("=> " + format_filename(f))
-                echo(ft.read() + "\n")
-                echo("-----------------------------------------------------------")
-        ctx.exit()
-
-    if not param_decls:
-        param_decls = ("--show-headers",)
-
-    kwargs.setdefault("is_flag", True)
-    kwargs.setdefault("expose_value", False)
-    kwargs.setdefault("is_eager", True)
-    kwargs.setdefault(
-        "help", "Print all available headers and exit."
-    )
-    kwargs["callback"] = callback
-    return option(*param_decls, **kwargs)
 
+def version_option(*param_decls, prog_name=None, **kwargs):
+    """Add a ``--version`` option which immediately prints the
+    package version and exits the program. Unlike click's own
+    ``version_option``, the version is only resolved when requested.
+    :param param_decls: One or more option names. Defaults to the single
+        value ``"--version"``.
+    :param prog_name: The program name displayed with the version.
+    :param kwargs: Extra arguments are passed to :func:`option`.
+    """
 
-@contextlib.contextmanager
-def temp_filename(suffix=None):
-    """Context that introduces a temporary file.
+    def echo_version():
+        from . import __version__
 
-    Creates a temporary file, yields the name, and on context exit, deletes it.
-    (In contrast, tempfile.NamedTemporaryFile() provides a 'file' object and
-    deletes the file as soon as the file object is closed, thus the temporary file
-    cannot be safely re-opened by another library or process.)
+        echo("%s, version %s" % (prog_name or __package__, __version__))
 
-    Args:
-        suffix: desired filename extension (e.g. '.txt').
+    kwargs.setdefault("help", "Show the version and exit.")
+    return _eager_option(echo_version, param_decls or ("--version",), kwargs)
 
-    Yields:
-        The name of the temporary file.
-    """
 
-    import tempfile
-
-    try:
-        f = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-        f.readlines()
-        tmp_name = f.name
-        f.close()
-        yield tmp_name
-    finally:
-        os.unlink(tmp_name)
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
 
 
 class ColorFormatter(logging.Formatter):
     def __init__(self, style_kwargs):
         super().__init__()
         self.style_kwargs = style_kwargs
+        # styled level prefixes, built once rather than per record
+        self._prefixes = {
+            lvl: click.style(f"{lvl}: ", **kw) for lvl, kw in style_kwargs.items()
+        }
+        # regular records dispatch on levelno ('exception' is handled by name)
+        self._by_no = {
+            _LEVELS[lvl]: pfx for lvl, pfx in self._prefixes.items() if lvl in _LEVELS
+        }
+
+    def _styled(self, msg, prefix):
+        # prefix each line of the message with its styled level
+        if not prefix:
+            return msg
+        if "\n" not in msg:
+            return prefix + msg
+        return "\n".join(prefix + x for x in msg.splitlines())
 
     def formatMessage(self, record):
         # format 'exception' level log event messages
         msg = super().formatMessage(record)
-        level = "exception"
-        if self.style_kwargs.get(level):
-            prefix = click.style("{}: ".format(level), **self.style_kwargs[level])
-            return "\n".join(prefix + x for x in msg.splitlines())
-        return msg
+        return self._styled(msg, self._prefixes.get("exception"))
 
     def format(self, record):
         if not record.exc_info:
-            level = record.levelname.lower()
-            msg = record.getMessage()
-            if self.style_kwargs.get(level):
-                prefix = click.style("{}: ".format(level), **self.style_kwargs[level])
-                msg = "\n".join(prefix + x for x in msg.splitlines())
-            return msg
+            return self._styled(record.getMessage(), self._by_no.get(record.levelno))
         return logging.Formatter.format(self, record)
 
 
@@ -188,11 +261,17 @@ class ProcLogFileFormatter(logging.Formatter):
     Styles logging levels for the optional 'processing' logger.
     """
 
+    def __init__(self):
+        super().__init__()
+        # one formatter per display style, no per-record fmt mutation
+        self._info = logging.Formatter("%(message)s")
+        self._crit = logging.Formatter("[*** %(levelname)s ***]: %(message)s")
+        self._other = logging.Formatter("[%(levelname)s]: %(message)s")
+
     def format(self, record):
-        if record.levelno == logging.INFO:
-            self._style._fmt = "%(message)s"
-        elif record.levelno == logging.CRITICAL or record.levelno == logging.FATAL:
-            self._style._fmt = "[*** %(levelname)s ***]: %(message)s"
-        else:  # DEBUG, WARNING, ERROR
-            self._style._fmt = "[%(levelname)s]: %(message)s"
-        return super().format(record)
+        lvl = record.levelno
+        if lvl == logging.INFO:
+            return self._info.format(record)
+        if lvl >= logging.CRITICAL:  # CRITICAL, FATAL
+            return self._crit.format(record)
+        return self._other.format(record)  # DEBUG, WARNING, ERROR
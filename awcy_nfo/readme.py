@@ -1,34 +1,124 @@
-import io
-import shutil
+import os
 import logging
-import pkgutil
+import functools
 
-from enum import Enum
-from errno import ENOENT
 from datetime import datetime
+from stat import S_ISDIR, S_ISREG
 from pathlib import PurePath, Path
+from logging.handlers import MemoryHandler
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml.constructor import ConstructorError
+from errno import ENOENT, ENOTDIR, ELOOP, ENAMETOOLONG, EBADF
 
-from .helpers import ProcLogFileFormatter, temp_filename
-from .serializable import yaml, ReadMeStyle, Section, Subsection
+from .helpers import ProcLogFileFormatter, load_resource
+from .serializable import yaml, style_yaml, ReadMeStyle, Section, Subsection
 
 app_name = "AWCY?NFO"  # stylized display name
 def_style = "classic.yaml"  # default fallback style
+log_banner = "~" * 80  # process log banner, 80 chars (terminal width)
+log_title = ("..:: " + app_name + " LOG ::..").center(80)
+alignments = frozenset(("center", "left", "right"))  # valid alignment options
+align_fns = {"center": str.center, "left": str.ljust, "right": str.rjust}
 
 # when imported as a module: default null handler
 logger = logging.getLogger(__package__)
 logger.addHandler(logging.NullHandler())
 
 
-class LineType(Enum):
-    TEXT = 1
-    SPACER = 2
-    DIVIDER = 3
-    SECTION = 4
-    SUBSECTION = 5
+@functools.lru_cache(maxsize=64)
+def _resolve(path, cwd):
+    # resolve a relative path, cached per working directory (resolve hits the fs)
+    return Path(cwd, path).resolve()
+
+
+# errnos meaning "nothing usable at this path". pathlib's is_file()/is_dir()
+# ignore ENOENT, ENOTDIR, EBADF and ELOOP; ENAMETOOLONG is a deliberate addition
+# (an over-long -o/-f name is treated as missing, not as a crash)
+_stat_ignored = frozenset((ENOENT, ENOTDIR, EBADF, ELOOP, ENAMETOOLONG))
+
+
+def _is_missing(exc):
+    # shared by the path probes and reads, so both agree on what 'missing' is.
+    # ValueError: unrepresentable path (e.g. embedded null), as pathlib ignores
+    if isinstance(exc, OSError):
+        return exc.errno in _stat_ignored
+    return isinstance(exc, ValueError)
+
+
+@functools.lru_cache(maxsize=64)
+def _norm(name, ext):
+    # lowercase resource name with extension (few distinct, repeated names)
+    if name is None:
+        return None
+    name = name.lower()
+    return name if name.endswith(ext) else name + ext
+
+
+def _stat_or_none(path):
+    # os.stat result, or None when nothing (usable) exists at path
+    try:
+        return os.stat(path)
+    except (OSError, ValueError) as e:
+        if _is_missing(e):
+            return None
+        raise
+
+
+def _not_a_file(exc):
+    # error reading a path meaning "no such regular file" (params fall back to
+    # package resources): missing as for the probes above, a directory, or a
+    # symlink loop reported by Path.resolve() as RuntimeError (python < 3.13)
+    return _is_missing(exc) or isinstance(exc, (IsADirectoryError, RuntimeError))
+
+# yaml node types handled by process_content, with their log names
+_content_names = {
+    str: "String",
+    CommentedMap: "CommentedMap",
+    CommentedSeq: "CommentedSeq",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _content_type(cls):
+    # handled base type of a node class (e.g. ruamel's ScalarString -> str)
+    for base in cls.__mro__:
+        if base in _content_names:
+            return base
+    return None
 
 
 class ReadMe(object):
+    # fixed attribute layout: no per-instance __dict__, faster attribute reads
+    __slots__ = (
+        "_yamlfile",
+        "_output",
+        "_filename",
+        "_header",
+        "_style",
+        "_log_to_file",
+        "_log_verbosity",
+        "_doc_lines",
+        "_append",
+        "_doc_template",
+        "_doc_style",
+        "_def_style",
+        "_default_header_name",
+        "_style_cache",
+        "_div_line",
+        "_spacer_line",
+        "_text_metrics",
+        "_header_alignment",
+        "comp_sects",
+        "init_lc_col",
+        "used_lc_col",
+        "curr_lc_col",
+        "undent_count",
+        "indent_count",
+        "indent_is_init",
+        "yaml_path",
+        "readme_path",
+    )
+
     def __init__(
         self,
         yamlfile,
@@ -54,6 +144,11 @@ class ReadMe(object):
         self.undent_count = 0
         self.indent_count = 0
         self.indent_is_init = False
+        self._style_cache = {}
+        self._div_line = None
+        self._spacer_line = None
+        self._text_metrics = None
+        self._header_alignment = None
 
     @property
     def yamlfile(self):
@@ -98,12 +193,13 @@ class ReadMe(object):
     @doc_lines.setter
     def doc_lines(self, val):
         self._doc_lines = val
+        self._append = val.append  # bound once, used for every emitted line
 
     @staticmethod
     def check_ext(file, ext):
-        if file is not None:
-            if PurePath(file).suffix != ext:
-                return file + ext
+        # plain suffix test, no PurePath built per call
+        if file is not None and not file.endswith(ext):
+            return file + ext
         return file
 
     @staticmethod
@@ -116,10 +212,10 @@ class ReadMe(object):
     @staticmethod
     def abs_path(ppath):
         # get absolute path of a purepath
-        if ppath.is_absolute:
-            return Path(ppath)
+        if ppath.is_absolute():
+            return ppath if isinstance(ppath, Path) else Path(ppath)
         else:
-            return Path(ppath).resolve()
+            return _resolve(str(ppath), os.getcwd())
 
     @staticmethod
     def clean_str(dirty):
@@ -138,10 +234,19 @@ class ReadMe(object):
         # string to list conversion including delimiters
         if not s:
             return [""]  # same as string.split()
-        # get highest available char +1 not used in the string
-        # this will fail if ord(max(s)) = 0x10FFFF (ValueError)
-        p = chr(ord(max(s)) + 1)
-        return s.replace(d, d + p).split(p)
+        # re-attach the delimiter to the end of each chunk but the last
+        parts = s.split(d)
+        last = parts.pop()
+        parts = [p + d for p in parts]
+        parts.append(last)
+        return parts
+
+    @staticmethod
+    def to_strs(items):
+        # yaml lists are almost always all strings, skip the conversion then
+        if all(type(x) is str for x in items):
+            return items
+        return [str(x) for x in items]
 
     @staticmethod
     def calc_percent(pct, tot):
@@ -158,40 +263,42 @@ class ReadMe(object):
 
     @staticmethod
     def get_template_attr(yaml, attr):
-        cattr = ReadMe.clean_str(attr)
-        return ReadMe.clean_str(yaml.get(cattr))
+        # attr names are (interned) literals, only the value needs cleaning
+        return ReadMe.clean_str(yaml.get(attr))
 
     @staticmethod
     def get_style_attr(yaml, attr):
-        cattr = ReadMe.clean_str(attr)
-        return ReadMe.clean_str(getattr(yaml, cattr, None))
+        return ReadMe.clean_str(getattr(yaml, attr, None))
 
     @staticmethod
     def get_default_attr(yaml, attr):
-        cattr = ReadMe.clean_str(attr)
-        return ReadMe.clean_str(getattr(yaml, cattr, None))
+        return ReadMe.clean_str(getattr(yaml, attr, None))
 
-    @staticmethod
-    def get_fallback_attr(style_yaml, default_yaml, attr):
-        # try to get attr from style doc, else fallback to default
-        sval = ReadMe.get_style_attr(style_yaml, attr)
+    def get_fallback_attr(self, attr):
+        # try to get attr from style doc, else fallback to default. the style is
+        # constant for the whole document, so each attr is resolved (and any
+        # fallback warning logged) only once, then served from the cache.
+        try:
+            return self._style_cache[attr]
+        except KeyError:
+            pass
+        sval = self.get_style_attr(self._doc_style, attr)
         if sval is None:
-            sval = ReadMe.get_default_attr(default_yaml, attr)
-            logger.warning("Using fallback value '%s' for '%s'." % (sval, attr))
-            # assign fallback value to the template value, no need to repeat
-            # this warning each time the attribute is accessed from now on.
-            setattr(style_yaml, ReadMe.clean_str(attr), sval)
+            sval = self.get_default_attr(self._def_style, attr)
+            logger.warning("Using fallback value '%s' for '%s'.", sval, attr)
+        self._style_cache[attr] = sval
         return sval
 
     @staticmethod
     def get_resource_data(group, file):
         # load resource file as byte stream
         try:
-            d = pkgutil.get_data(__name__, f"{group}/{file}")
-            return d
+            data = load_resource(group, file)
         except Exception:
-            logger.error("Invalid resource file: %s/%s" % (group, file))
-            return None
+            data = None
+        if data is None:
+            logger.error("Invalid resource file: %s/%s", group, file)
+        return data
 
     @staticmethod
     def get_section_key(yaml, name):
@@ -210,71 +317,98 @@ class ReadMe(object):
                 return ReadMe.clean_str(d.get(key))
 
     @staticmethod
-    def make_div(style_yaml, default_yaml):
-        ll = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_length")
-        strt = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_start_char")
-        stop = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_end_char")
-        chr = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_div_char")
-        pct = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_div_percent")
-        alg = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_div_alignment")
-        ll = ll - len(strt) - len(stop)
-        fl = ReadMe.calc_percent(ll, pct)
-        div = "".join([char * fl for char in chr])
-        if alg == "right":
-            return [strt, div.rjust(ll), stop, "\n"]
-        elif alg == "left":
-            return [strt, div.ljust(ll), stop, "\n"]
-        elif alg == "center":
-            return [strt, div.center(ll), stop, "\n"]
-
-    @staticmethod
-    def make_spacer(style_yaml, default_yaml):
-        ll = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_length")
-        strt = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_start_char")
-        stop = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_end_char")
-        fl = int(ll - len(strt) - len(stop))
-        spc = "".join([char * fl for char in " "])
-        return [strt, spc, stop, "\n"]
+    def flatten_mapping(list):
+        # merge non 'Section' yaml mappings into one dict, so repeated
+        # lookups skip the list scan (first non-null value wins, as above)
+        flat = {}
+        for d in list:
+            for k, v in d.items():
+                if v is not None:
+                    flat.setdefault(k, v)
+        return flat
+
+    def make_div(self):
+        # the divider is constant for the whole document, build it only once
+        if self._div_line is None:
+            ll = self.get_fallback_attr("line_length")
+            strt = self.get_fallback_attr("line_start_char")
+            stop = self.get_fallback_attr("line_end_char")
+            chr = self.get_fallback_attr("line_div_char")
+            pct = self.get_fallback_attr("line_div_percent")
+            alg = self.get_fallback_attr("line_div_alignment")
+            if len(chr) != 1:
+                logger.warning(
+                    "'line_div_char' should be a single character, got '%s'.", chr
+                )
+            ll = ll - len(strt) - len(stop)
+            halign = align_fns.get(alg)
+            # an invalid alignment is cached as "" (no divider) as well
+            self._div_line = ""
+            if halign is not None:
+                fl = ReadMe.calc_percent(ll, pct)
+                self._div_line = strt + halign(chr * fl, ll) + stop + "\n"
+        if not self._div_line:
+            return None
+        return [self._div_line]
+
+    def make_spacer(self):
+        # same as the divider, the spacer line never changes per document
+        if self._spacer_line is None:
+            ll = self.get_fallback_attr("line_length")
+            strt = self.get_fallback_attr("line_start_char")
+            stop = self.get_fallback_attr("line_end_char")
+            fl = int(ll - len(strt) - len(stop))
+            self._spacer_line = strt + " " * fl + stop + "\n"
+        return [self._spacer_line]
 
-    @staticmethod
     def make_text(
-        style_yaml,
-        default_yaml,
+        self,
         text=None,
         align=None,
         delimiter=" ",
         indent=0,
         sec_indent=0,
         ll_offset=0,  # offset for non standard typefaces (see primary credits)
+        writer=None,  # optional line sink (ie. doc_lines.append), else return lines
     ):
         if text:
-            lb = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_buffer")
-            ll = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_length")
-            strt = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_start_char")
-            stop = ReadMe.get_fallback_attr(style_yaml, default_yaml, "line_end_char")
+            lines = None
+            if writer is None:
+                lines = []
+                writer = lines.append
+            # line edges and base text width are per document, resolve once
+            if self._text_metrics is None:
+                lb = int(self.get_fallback_attr("line_buffer"))
+                ll = self.get_fallback_attr("line_length")
+                strt = self.get_fallback_attr("line_start_char")
+                stop = self.get_fallback_attr("line_end_char")
+                tl = ll - (len(strt) + len(stop) + lb + lb)
+                self._text_metrics = (lb, strt, stop, tl)
+            lb, strt, stop, tl = self._text_metrics
             # calc max length of a line
-            ml = ll - (len(strt) + len(stop) + int(lb) + int(lb) + indent + ll_offset)
+            ml = tl - (indent + ll_offset)
             if len(text) > ml:
-                lines = []
                 # split text to list w/delimiters and spaces
                 sk = ReadMe.split_keep(text, delimiter)
-                # iterate each string and calculate running length for slice
+                # iterate each string and calculate running length for slice,
+                # tracking offsets so each line is a single slice of 'text'
                 total = 0
-                start = 0
-                index = 0
+                start = 0  # chunk index the current line starts at
+                pos = 0  # offset of the current chunk
+                lstart = 0  # offset the current line starts at
+                lend = len(sk[0])  # offset past the last chunk on the line
                 for i, v in enumerate(sk):
+                    vend = pos + len(v)
                     total += len(v)
                     if total > ml:
-                        s = "".join(sk[start : index + 1]).lstrip()
+                        s = text[lstart:lend].lstrip()
                         if align == "center":
-                            lines.extend(ReadMe.center_text(s, ml, lb, strt, stop))
+                            writer(ReadMe.center_text(s, ml, lb, strt, stop))
                         if align == "left":
                             if start == 0:
-                                lines.extend(
-                                    ReadMe.left_text(s, ml, lb, strt, stop, indent)
-                                )
+                                writer(ReadMe.left_text(s, ml, lb, strt, stop, indent))
                             else:  # include secondary indent (not the first line)
-                                lines.extend(
+                                writer(
                                     ReadMe.left_text(
                                         s, ml, lb, strt, stop, indent, sec_indent
                                     )
@@ -282,105 +416,91 @@ class ReadMe(object):
                         # adjust max length with secondary indent for remaining lines
                         if start == 0:
                             ml -= sec_indent
-                        # update start index, count index, reset total char count
+                        # update start index and offsets, reset total char count
                         start = i
-                        index = i
+                        lstart = pos
+                        lend = vend
                         total = len(v)
                     else:
-                        index = i
+                        lend = vend
+                    pos = vend
                 # use any remaining totals on loop completion
                 if total > 0:
-                    s = "".join(sk[start : index + 1]).lstrip()
+                    s = text[lstart:lend].lstrip()
                     if align == "center":
-                        lines.extend(ReadMe.center_text(s, ml, lb, strt, stop))
+                        writer(ReadMe.center_text(s, ml, lb, strt, stop))
                     if align == "left":
-                        lines.extend(
+                        writer(
                             ReadMe.left_text(s, ml, lb, strt, stop, indent, sec_indent)
                         )
-                # return properly sized and aligned lines
-                return lines
             else:
                 if align == "center":
-                    return ReadMe.center_text(text, ml, lb, strt, stop)
+                    writer(ReadMe.center_text(text, ml, lb, strt, stop))
                 elif align == "left":
-                    return ReadMe.left_text(text, ml, lb, strt, stop, indent)
+                    writer(ReadMe.left_text(text, ml, lb, strt, stop, indent))
+            # properly sized and aligned lines (None when written to 'writer')
+            return lines
 
     @staticmethod
     def left_text(text, maxlen, edgbuf, startchr, stopchr, indent=0, sec_indent=0):
         if indent < 0:
-            logger.warning("Using a negative indent value: %s" % (indent))
-        return [
-            startchr
-            + f'{"": ^{edgbuf + indent + sec_indent}}'
-            + f"{text: <{maxlen}}"
-            + f'{"": ^{edgbuf}}'
-            + stopchr
-            + "\n"
-        ]
+            logger.warning("Using a negative indent value: %s", indent)
+        pad = " " * (edgbuf + indent + sec_indent)
+        epad = " " * edgbuf
+        return f"{startchr}{pad}{text: <{maxlen}}{epad}{stopchr}\n"
 
     @staticmethod
     def center_text(text, maxlen, edgbuf, startchr, stopchr):
-        return [
-            startchr
-            + f'{"": ^{edgbuf}}'
-            + f"{text: ^{maxlen}}"
-            + f'{"": ^{edgbuf}}'
-            + stopchr
-            + "\n"
-        ]
+        epad = " " * edgbuf
+        return f"{startchr}{epad}{text: ^{maxlen}}{epad}{stopchr}\n"
 
-    @staticmethod
-    def make_section(style_yaml, default_yaml, text=None):
+    def make_section(self, text=None):
         if text:
-            lst = ReadMe.make_div(style_yaml, default_yaml)
-            pr = ReadMe.get_fallback_attr(style_yaml, default_yaml, "section_pre")
-            ps = ReadMe.get_fallback_attr(style_yaml, default_yaml, "section_post")
-            al = ReadMe.get_fallback_attr(style_yaml, default_yaml, "section_alignment")
+            lst = self.make_div()
+            pr = self.get_fallback_attr("section_pre")
+            ps = self.get_fallback_attr("section_post")
+            al = self.get_fallback_attr("section_alignment")
             nl = len(text)
             if len(pr) > 0:
                 nl += 1  # add for the space between pre and title chars
             if len(ps) > 0:
                 nl += 1  # same as above but between title and post chars
             txt = pr + f"{text:^{nl}}" + ps
-            tl = ReadMe.make_text(style_yaml, default_yaml, text=txt, align=al)
+            tl = self.make_text(text=txt, align=al)
             lst.extend(tl)
-            bd = ReadMe.make_div(style_yaml, default_yaml)
+            bd = self.make_div()
             lst.extend(bd)
             return lst
 
-    @staticmethod
-    def make_subsection(style_yaml, default_yaml, text=None):
+    def make_subsection(self, text=None):
         if text:
-            lst = []  # ReadMe.make_spacer(style_yaml, default_yaml)
-            pr = ReadMe.get_fallback_attr(style_yaml, default_yaml, "subsection_pre")
-            ps = ReadMe.get_fallback_attr(style_yaml, default_yaml, "subsection_post")
-            al = ReadMe.get_fallback_attr(
-                style_yaml, default_yaml, "subsection_alignment"
-            )
+            lst = []  # self.make_spacer()
+            pr = self.get_fallback_attr("subsection_pre")
+            ps = self.get_fallback_attr("subsection_post")
+            al = self.get_fallback_attr("subsection_alignment")
             nl = len(text)
             if len(pr) > 0:
                 nl += 1  # add for the space between pre and title chars
             if len(ps) > 0:
                 nl += 1  # same as above but between title and post chars
             txt = pr + f"{text:^{nl}}" + ps
-            tl = ReadMe.make_text(style_yaml, default_yaml, text=txt, align=al)
+            tl = self.make_text(text=txt, align=al)
             lst.extend(tl)
-            bd = ReadMe.make_spacer(style_yaml, default_yaml)
+            bd = self.make_spacer()
             lst.extend(bd)
             return lst
 
-    @staticmethod
-    def primary_credits(data, styl, dflt):
+    def primary_credits(self, data):
         lines = []
         if "primary_thx" in data:
             thx = data["primary_thx"]
             if thx is not None:
-                lines.extend(ReadMe.make_spacer(styl, dflt))
-                hd = ReadMe.get_fallback_attr(styl, dflt, "credits_primary_thx")
-                lines.extend(ReadMe.make_subsection(styl, dflt, text=hd))
-                pr = ReadMe.get_fallback_attr(styl, dflt, "credits_pre")
-                ps = ReadMe.get_fallback_attr(styl, dflt, "credits_post")
-                of = ReadMe.get_fallback_attr(styl, dflt, "credits_offset")
+                lines.extend(self.make_spacer())
+                hd = self.get_fallback_attr("credits_primary_thx")
+                lines.extend(self.make_subsection(text=hd))
+                pr = self.get_fallback_attr("credits_pre")
+                ps = self.get_fallback_attr("credits_post")
+                of = self.get_fallback_attr("credits_offset")
                 for t in thx:
                     nl = len(t)
                     if len(pr) > 0:
@@ -389,9 +509,7 @@ class ReadMe(object):
                         nl += 1  # same as above but between thnx and post chars
                     txt = pr + f"{t:^{nl}}" + ps
                     lines.extend(
-                        ReadMe.make_text(
-                            styl,
-                            dflt,
+                        self.make_text(
                             text=txt,
                             align="center",
                             delimiter=" ",
@@ -402,58 +520,56 @@ class ReadMe(object):
                     )
         return lines
 
-    @staticmethod
-    def secondary_credits(data, styl, dflt):
+    def secondary_credits(self, data):
         lines = []
         if "secondary_thx" in data:
             thx = data["secondary_thx"]
             if thx is not None:
-                lines.extend(ReadMe.make_spacer(styl, dflt))
-                hd = ReadMe.get_fallback_attr(styl, dflt, "credits_secondary_thx")
-                lines.extend(ReadMe.make_subsection(styl, dflt, text=hd))
-                # add ' and' to the last creditor if needed
+                lines.extend(self.make_spacer())
+                hd = self.get_fallback_attr("credits_secondary_thx")
+                lines.extend(self.make_subsection(text=hd))
+                # convert to string adding commas (and ' and' to the last
+                # creditor if needed), leaving the template data untouched
+                thx = self.to_strs(thx)
                 if len(thx) >= 2:
-                    i = len(thx) - 1
-                    v = thx[i]
-                    thx[i] = "and " + v
-                # convert to string adding commas
-                thxstr = ", ".join(map(str, thx))
-                lines.extend(ReadMe.make_text(styl, dflt, thxstr, "center", ","))
+                    thxstr = ", ".join(thx[:-1]) + ", and " + thx[-1]
+                else:
+                    thxstr = ", ".join(thx)
+                lines.extend(self.make_text(thxstr, "center", ","))
         return lines
 
-    @staticmethod
-    def additional_thanks(data, styl, dflt):
+    def additional_thanks(self, data):
         lines = []
-        lines.extend(ReadMe.make_spacer(styl, dflt))
-        hd = ReadMe.get_fallback_attr(styl, dflt, "credits_additional_thx")
-        lines.extend(ReadMe.make_subsection(styl, dflt, text=hd))
+        lines.extend(self.make_spacer())
+        hd = self.get_fallback_attr("credits_additional_thx")
+        lines.extend(self.make_subsection(text=hd))
         if "additional_thx" in data:
             thx = data["additional_thx"]
             if thx is not None:
-                thxstr = ", ".join(map(str, thx)) + ", and"  # add ', and' for team thx
-                lines.extend(ReadMe.make_text(styl, dflt, thxstr, "center", ","))
-                lines.extend(ReadMe.make_spacer(styl, dflt))
+                # add ', and' for team thx
+                thxstr = ", ".join(self.to_strs(thx)) + ", and"
+                lines.extend(self.make_text(thxstr, "center", ","))
+                lines.extend(self.make_spacer())
         if "team_thx" in data:
             tthx = data["team_thx"]
             if tthx is None:
-                tthx = ReadMe.get_fallback_attr(styl, dflt, "credits_team_thx")
+                tthx = self.get_fallback_attr("credits_team_thx")
         else:
-            tthx = ReadMe.get_fallback_attr(styl, dflt, "credits_team_thx")
-        lines.extend(ReadMe.make_text(styl, dflt, tthx, "center"))
-        lines.extend(ReadMe.make_spacer(styl, dflt))
+            tthx = self.get_fallback_attr("credits_team_thx")
+        lines.extend(self.make_text(tthx, "center"))
+        lines.extend(self.make_spacer())
         return lines
 
     def write_to_file(self):
         if hasattr(self, "readme_path"):
             if len(self.doc_lines) > 0:
                 with open(self.readme_path, "w", encoding="utf-8") as wf:
-                    wf.writelines(self.doc_lines)
+                    wf.write("".join(self.doc_lines))  # one bulk write
             else:
                 logger.error("Failed readme file creation, no content to write.")
 
-    def make_line(
+    def emit_text(
         self,
-        type=None,
         text=None,
         align=None,
         delimiter=" ",
@@ -461,27 +577,29 @@ class ReadMe(object):
         sec_indent=0,
         ll_offset=0,
     ):
-        r = None
-        if type is LineType.TEXT:
-            r = self.make_text(
-                self._doc_style,
-                self._def_style,
-                text,
-                align,
-                delimiter,
-                indent,
-                sec_indent,
-                ll_offset,
-            )
-        elif type is LineType.SPACER:
-            r = self.make_spacer(self._doc_style, self._def_style)
-        elif type is LineType.DIVIDER:
-            r = self.make_div(self._doc_style, self._def_style)
-        elif type is LineType.SECTION:
-            r = self.make_section(self._doc_style, self._def_style, text)
-        elif type is LineType.SUBSECTION:
-            r = self.make_subsection(self._doc_style, self._def_style, text)
-        # add valid line results to doc_lines
+        # wrapped lines are written straight to doc_lines
+        self.make_text(
+            text, align, delimiter, indent, sec_indent, ll_offset, self._append
+        )
+
+    def emit_spacer(self):
+        if self._spacer_line is None:
+            self.make_spacer()
+        self._append(self._spacer_line)
+
+    def emit_div(self):
+        if self._div_line is None:
+            self.make_div()
+        if self._div_line:  # "" when the alignment is invalid
+            self._append(self._div_line)
+
+    def emit_section(self, text):
+        r = self.make_section(text)
+        if r is not None:
+            self.doc_lines.extend(r)
+
+    def emit_subsection(self, text):
+        r = self.make_subsection(text)
         if r is not None:
             self.doc_lines.extend(r)
 
@@ -498,12 +616,12 @@ class ReadMe(object):
                         self.indent_count = 0
                         self.indent_is_init = False
                         # make optional section
-                        logger.info("=> %s ..." % sk.name)
-                        self.make_line(type=LineType.SECTION, text=sk.name)
-                        self.make_line(type=LineType.SPACER)
+                        logger.info("=> %s ...", sk.name)
+                        self.emit_section(sk.name)
+                        self.emit_spacer()
                         self.process_content(sk, sc)
                         if sk.spacing == "single":
-                            self.make_line(type=LineType.SPACER)
+                            self.emit_spacer()
 
     def init_indent(self):
         # track indent init per section
@@ -533,90 +651,93 @@ class ReadMe(object):
             return idnt - udnt
 
     def process_content(self, sect, cont, indent=-1, sec_indent=0):
-        logger.debug("sect: %s" % (sect))
-        logger.debug("cont: %s" % (cont))
-        logger.debug("indent: %s" % (indent))
-        logger.debug("sec_indent: %s" % (sec_indent))
-
-        if isinstance(cont, str):
-            logger.debug("(String Instance)")
-            ls = cont.split("\n")
-            for i, l in enumerate(ls):
-                if len(l) == 0:
-                    # do not add spacer for last element (textblocks)
-                    if i != len(ls) - 1:
-                        self.make_line(type=LineType.SPACER)
-                else:
-                    # handle negative indent (textblocks)
-                    if indent == -1:
-                        indent = 0
-                    # bake bread...
-                    self.make_line(
-                        type=LineType.TEXT,
-                        text=l,
-                        align=sect.alignment,
-                        delimiter=" ",
-                        indent=indent,
-                        sec_indent=sec_indent,
-                    )
-                    if sect.spacing == "double":
-                        self.make_line(type=LineType.SPACER)
-                    # set indent_init flag true
-                    self.init_indent()
-        elif isinstance(cont, CommentedMap):
-            logger.debug("(CommentedMap Instance)")
-            for k, v in cont.items():
-                if isinstance(k, Subsection):
-                    logger.debug("(Subsection Instance (key))")
-                    if self.indent_is_init:
-                        self.make_line(type=LineType.SPACER)
-                    self.make_line(type=LineType.SUBSECTION, text=k.name)
-                else:
-                    if indent == -1:
-                        ident = self.calc_indent(cont.lc.col - 2)
-                    else:
-                        ident = indent
-                if isinstance(v, str):
-                    logger.debug("Process String (value)")
-                    self.process_content(
-                        sect, str(k) + ": " + v, ident, len(str(k) + ": ")
-                    )
-                if isinstance(v, CommentedMap):
-                    if not isinstance(k, Subsection):
-                        logger.debug("Process CommentedMap (value)")
-                        self.process_content(
-                            sect, str(k) + ": ", ident, len(str(k) + ": ")
-                        )
-                        self.process_content(sect, v, ident)
-                    else:
-                        logger.debug("Process Subsection (value)")
-                        self.process_content(sect, v)
-                if isinstance(v, CommentedSeq):
-                    if not isinstance(k, Subsection):
-                        logger.debug("Process CommentedSeq (key)")
-                        self.process_content(
-                            sect, str(k) + ": ", ident, len(str(k) + ": ")
-                        )
-                        self.process_content(sect, v, ident + 2)  # +2 indent tracking
-                    else:
-                        logger.debug("Process Subsection (value)")
-                        self.process_content(sect, v)
-        elif isinstance(cont, CommentedSeq):
-            logger.debug("(CommentedSeq Instance)")
-            for idx, item in enumerate(cont):
+        # called per yaml node: skip formatting (node reprs) unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("sect: %s", sect)
+            logger.debug("cont: %s", cont)
+            logger.debug("indent: %s", indent)
+            logger.debug("sec_indent: %s", sec_indent)
+
+        handler = self._content_handlers.get(_content_type(type(cont)))
+        if handler is not None:
+            handler(self, sect, cont, indent, sec_indent)
+
+    def _process_str(self, sect, cont, indent, sec_indent):
+        logger.debug("(String Instance)")
+        ls = cont.split("\n")
+        for i, l in enumerate(ls):
+            if len(l) == 0:
+                # do not add spacer for last element (textblocks)
+                if i != len(ls) - 1:
+                    self.emit_spacer()
+            else:
+                # handle negative indent (textblocks)
+                if indent == -1:
+                    indent = 0
+                # bake bread...
+                self.emit_text(
+                    text=l,
+                    align=sect.alignment,
+                    delimiter=" ",
+                    indent=indent,
+                    sec_indent=sec_indent,
+                )
+                if sect.spacing == "double":
+                    self.emit_spacer()
+                # set indent_init flag true
+                self.init_indent()
+
+    def _process_map(self, sect, cont, indent, sec_indent):
+        logger.debug("(CommentedMap Instance)")
+        for k, v in cont.items():
+            is_sub = isinstance(k, Subsection)
+            if is_sub:
+                logger.debug("(Subsection Instance (key))")
+                if self.indent_is_init:
+                    self.emit_spacer()
+                self.emit_subsection(k.name)
+            else:
                 if indent == -1:
                     ident = self.calc_indent(cont.lc.col - 2)
                 else:
                     ident = indent
-                if isinstance(item, str):
-                    logger.debug("Process String (item)")
-                    self.process_content(sect, item, ident)
-                if isinstance(item, CommentedMap):
-                    logger.debug("Process CommentedMap (item)")
-                    self.process_content(sect, item, ident)
-                if isinstance(item, CommentedSeq):
-                    logger.debug("Process CommentedSeq (item)")
-                    self.process_content(sect, item, ident)
+            vtype = _content_type(type(v))
+            if vtype is None:
+                continue
+            prefix = str(k) + ": "
+            if vtype is str:
+                logger.debug("Process String (value)")
+                self.process_content(sect, prefix + v, ident, len(prefix))
+            elif is_sub:
+                logger.debug("Process Subsection (value)")
+                self.process_content(sect, v)
+            elif vtype is CommentedMap:
+                logger.debug("Process CommentedMap (value)")
+                self.process_content(sect, prefix, ident, len(prefix))
+                self.process_content(sect, v, ident)
+            else:
+                logger.debug("Process CommentedSeq (key)")
+                self.process_content(sect, prefix, ident, len(prefix))
+                self.process_content(sect, v, ident + 2)  # +2 indent tracking
+
+    def _process_seq(self, sect, cont, indent, sec_indent):
+        logger.debug("(CommentedSeq Instance)")
+        for item in cont:
+            if indent == -1:
+                ident = self.calc_indent(cont.lc.col - 2)
+            else:
+                ident = indent
+            itype = _content_type(type(item))
+            if itype is not None:
+                logger.debug("Process %s (item)", _content_names[itype])
+                self.process_content(sect, item, ident)
+
+    # yaml node type -> content handler
+    _content_handlers = {
+        str: _process_str,
+        CommentedMap: _process_map,
+        CommentedSeq: _process_seq,
+    }
 
     def make_rls_notes(self):
         logger.info("=> Release Notes ...")
@@ -626,16 +747,16 @@ class ReadMe(object):
             "Required template section '%s', not found." % "Release Notes",
         )
         # make release notes section head
-        self.make_line(type=LineType.SECTION, text=sk.name)
-        self.make_line(type=LineType.SPACER)
+        self.emit_section(sk.name)
+        self.emit_spacer()
         # get section content
         sv = self._doc_template.get(sk)
         if sv is not None:
             self.process_content(sk, sv, 0)
             if sk.spacing == "single":
-                self.make_line(type=LineType.SPACER)
+                self.emit_spacer()
         else:  # blank release notes
-            self.make_line(type=LineType.SPACER)
+            self.emit_spacer()
         # add to completed sections
         self.comp_sects.append(sk.name)
 
@@ -647,331 +768,292 @@ class ReadMe(object):
             "Required template section '%s', not found." % "Credits",
         )
         # make credits section head
-        self.make_line(type=LineType.SECTION, text=sk.name)
+        self.emit_section(sk.name)
         # get section content
         sv = self._doc_template.get(sk)
         if sv is not None:
-            r = ReadMe.primary_credits(sv, self._doc_style, self._def_style)
+            r = self.primary_credits(sv)
             if r is not None:
                 self.doc_lines.extend(r)
-            s = ReadMe.secondary_credits(sv, self._doc_style, self._def_style)
+            s = self.secondary_credits(sv)
             if s is not None:
                 self.doc_lines.extend(s)
-            a = ReadMe.additional_thanks(sv, self._doc_style, self._def_style)
+            a = self.additional_thanks(sv)
             if a is not None:
                 self.doc_lines.extend(a)
         else:  # if no credits are set, thank the team and move on
-            self.make_line(type=LineType.SPACER)
-            tmthx = ReadMe.get_fallback_attr(
-                self._doc_style, self._def_style, "credits_team_thx"
-            )
-            self.make_line(type=LineType.TEXT, text=tmthx, align="center")
-            self.make_line(type=LineType.SPACER)
+            self.emit_spacer()
+            tmthx = self.get_fallback_attr("credits_team_thx")
+            self.emit_text(text=tmthx, align="center")
+            self.emit_spacer()
         # add section to completed
         self.comp_sects.append(sk.name)
 
     def make_about(self):
         logger.info("=> About ...")
-        self.make_line(type=LineType.DIVIDER)
-        self.make_line(type=LineType.SPACER)
+        self.emit_div()
+        self.emit_spacer()
         # get required section key and verify it exists
         sk = self.check_req(
             self.get_section_key(self._doc_template, "About"),
             "Required template section '%s', not found." % "About",
         )
         # get section content
-        sv = self._doc_template.get(sk)
+        sv = self.flatten_mapping(self._doc_template.get(sk))
         # verify required section attributes exist
         t = self.check_req(
-            self.get_yaml_mapping(sv, "title"),
+            self.clean_str(sv.get("title")),
             "Required template attribute '%s', not found." % "title",
         )
         v = self.check_req(
-            self.check_version(self.get_yaml_mapping(sv, "version")),
+            self.check_version(self.clean_str(sv.get("version"))),
             "Required template attribute '%s', not found." % "version",
         )
         # finally, make lines for available attributes
-        self.make_line(type=LineType.TEXT, text=t, align=sk.alignment)
-        s = self.get_yaml_mapping(sv, "subtitle")
-        self.make_line(type=LineType.TEXT, text=s, align=sk.alignment)
-        self.make_line(type=LineType.TEXT, text=v, align=sk.alignment)
-        self.make_line(type=LineType.SPACER)
+        self.emit_text(text=t, align=sk.alignment)
+        s = self.clean_str(sv.get("subtitle"))
+        self.emit_text(text=s, align=sk.alignment)
+        self.emit_text(text=v, align=sk.alignment)
+        self.emit_spacer()
         # add section to completed
         self.comp_sects.append(sk.name)
 
     def make_footer(self):
         logger.info("=> Footer...")
-        self.make_line(type=LineType.DIVIDER)
-        self.make_line(type=LineType.SPACER)
-        algn = self.get_fallback_attr(
-            self._doc_style, self._def_style, "footer_alignment"
-        )
-        ftr = self.get_fallback_attr(self._doc_style, self._def_style, "footer")
-        self.make_line(type=LineType.TEXT, text=ftr, align=algn)
-        sub = self.get_fallback_attr(self._doc_style, self._def_style, "subfooter")
-        self.make_line(type=LineType.TEXT, text=sub, align=algn)
-        join = self.get_fallback_attr(self._doc_style, self._def_style, "contact_us")
-        self.make_line(type=LineType.TEXT, text=join, align=algn)
-        self.make_line(type=LineType.SPACER)
-        self.make_line(type=LineType.DIVIDER)
+        self.emit_div()
+        self.emit_spacer()
+        algn = self.get_fallback_attr("footer_alignment")
+        ftr = self.get_fallback_attr("footer")
+        self.emit_text(text=ftr, align=algn)
+        sub = self.get_fallback_attr("subfooter")
+        self.emit_text(text=sub, align=algn)
+        join = self.get_fallback_attr("contact_us")
+        self.emit_text(text=join, align=algn)
+        self.emit_spacer()
+        self.emit_div()
 
     def make_header(self):
-        hbytes = io.BytesIO(self.load_header())
-        halign = self.get_header_alignment()
-        lineln = self.get_fallback_attr(self._doc_style, self._def_style, "line_length")
+        htext = self.load_header().decode(encoding="utf-8")
+        halign = align_fns.get(self.get_header_alignment())
+        lineln = self.get_fallback_attr("line_length")
         logger.info("=> Header...")
         # for each line, rstrip (remove \n), then readd the right side block spacing,
         # (restoring original line length), align, add new \n, and append to doc_lines.
-        for hbl in hbytes.readlines():
-            otxt = hbl.decode(encoding="utf-8")
-            olen = len(otxt)
-            stxt = otxt.rstrip()
-            slen = len(stxt)
-            spce = "".join([char * (olen - slen) for char in " "])
-            ntxt = "".join([stxt, spce])
-            if halign == "right":
-                self.doc_lines.extend([ntxt.rjust(lineln), "\n"])
-            elif halign == "left":
-                self.doc_lines.extend([ntxt.ljust(lineln), "\n"])
-            elif halign == "center":
-                self.doc_lines.extend([ntxt.center(lineln), "\n"])
+        if halign is not None:
+            for otxt in htext.splitlines(keepends=True):
+                ntxt = otxt.rstrip().ljust(len(otxt))
+                self.doc_lines.append(f"{halign(ntxt, lineln)}\n")
         # add subheader block (always centered)
         logger.info("=> Subheader...")
-        subhdr = self.get_fallback_attr(self._doc_style, self._def_style, "subheader")
+        subhdr = self.get_fallback_attr("subheader")
         self.doc_lines.extend(["\n", subhdr.center(lineln), "\n", "\n"])
 
     def get_header_alignment(self):
-        alignments = ["center", "left", "right"]
+        # resolved once per document, template -> style -> default
+        if self._header_alignment is not None:
+            return self._header_alignment
         ha = self.get_template_attr(self._doc_template, "header_alignment")
         if ha is not None and ha.lower() in alignments:
-            logger.info("HeaderAlignment: '%s' (template)" % ha)
-            return ha
+            logger.info("HeaderAlignment: '%s' (template)", ha)
+            self._header_alignment = ha.lower()
+            return self._header_alignment
         ha = self.get_style_attr(self._doc_style, "header_alignment")
         if ha is not None and ha.lower() in alignments:
-            logger.info("HeaderAlignment: '%s' (style)" % ha)
-            return ha
+            logger.info("HeaderAlignment: '%s' (style)", ha)
+            self._header_alignment = ha.lower()
+            return self._header_alignment
         ha = self.get_default_attr(self._def_style, "header_alignment").lower()
         if ha in alignments:
-            logger.warning("Using fallback value '%s' for 'header_alignment'." % ha)
-            logger.info("HeaderAlignment: '%s' (default)" % ha)
-            return ha
+            logger.warning("Using fallback value '%s' for 'header_alignment'.", ha)
+            logger.info("HeaderAlignment: '%s' (default)", ha)
+            self._header_alignment = ha
+            return self._header_alignment
 
     def load_header(self):
-        hptr = self.load_header_params()
-        if hptr is None:
-            hptr = self.load_header_template()
-        if hptr is None:
-            hptr = self.load_header_style()
-        if hptr is None:
-            hptr = self.load_header_default()
+        hdrdflt = self._default_header_name
+        hptr = self.load_fallback(
+            "headers",
+            (
+                ("parameter", _norm(self.header, ".txt"), True, "template header"),
+                (
+                    "template",
+                    _norm(self.get_template_attr(self._doc_template, "header"), ".txt"),
+                    False,
+                    "style header",
+                ),
+                (
+                    "style",
+                    _norm(self.get_style_attr(self._doc_style, "header"), ".txt"),
+                    False,
+                    "default '%s' header" % hdrdflt,
+                ),
+            ),
+        )
         if hptr is None:
-            hdrdflt = self.check_ext(
-                self.get_default_attr(self._def_style, "header").lower(), ".txt"
-            )
-            raise IOError(ENOENT, "Invalid default fallback header '%s'." % hdrdflt)
+            hptr = self.get_resource_data("headers", hdrdflt)
+            if hptr is None:
+                raise IOError(
+                    ENOENT, "Invalid default fallback header '%s'." % hdrdflt
+                )
+            logger.info("Header: '%s' (default),", hdrdflt)
         return hptr
 
-    def load_header_default(self):
-        hdrdflt = self.check_ext(
-            self.get_default_attr(self._def_style, "header").lower(), ".txt"
-        )
-        hptr = self.get_resource_data("headers", hdrdflt)
-        if hptr is not None:
-            logger.info("Header: '%s' (default)," % hdrdflt)
-            return hptr
-        return None
-
-    def load_header_style(self):
-        headername = self.check_ext(
-            self.get_style_attr(self._doc_style, "header"), ".txt"
-        )
-        if headername is not None:
-            headername = headername.lower()
-            hptr = self.get_resource_data("headers", headername)
-            if hptr is not None:
-                logger.info("Header: '%s' (style)" % headername)
-                return hptr
-            hdrdflt = self.check_ext(
-                self.get_default_attr(self._def_style, "header").lower(), ".txt"
-            )
-            logger.warning(
-                "Invalid header style '%s', falling back to default '%s' header."
-                % (headername, hdrdflt)
-            )
-        return None
-
-    def load_header_template(self):
-        headername = self.check_ext(
-            self.get_template_attr(self._doc_template, "header"), ".txt"
+    def load_style(self):
+        sptr = self.load_fallback(
+            "styles",
+            (
+                ("parameter", _norm(self.style, ".yaml"), True, "template style"),
+                (
+                    "template",
+                    _norm(self.get_template_attr(self._doc_template, "style"), ".yaml"),
+                    False,
+                    "default '%s' style" % def_style,
+                ),
+            ),
+            self.parse_style,
         )
-        if headername is not None:
-            headername = headername.lower()
-            hptr = self.get_resource_data("headers", headername)
-            if hptr is not None:
-                logger.info("Header: '%s' (template)" % headername)
-                return hptr
+        if sptr is None:
+            # same resource as the fallback style, already parsed in create_readme
+            sptr = self._def_style
+            if not isinstance(sptr, ReadMeStyle):
+                raise IOError(
+                    ENOENT, "Invalid default fallback style '%s'." % def_style
+                )
+            logger.info("Style: '%s' (default),", def_style)
+        return sptr
+
+    def load_fallback(self, group, sources, parse=None):
+        # first valid resource from (kind, name, local, next) sources, in order.
+        # 'local' names may be external files, 'next' names the following source.
+        label = group[:-1]  # headers -> header
+        for kind, name, local, fallback in sources:
+            if name is None:
+                continue
+            data = self.read_resource(group, name, local)
+            if parse is not None:
+                data = parse(data)
+            if data is not None:
+                logger.info("%s: '%s' (%s)", label.title(), name, kind)
+                return data
             logger.warning(
-                "Invalid header template '%s', falling back to style header."
-                % (headername)
+                "Invalid %s %s '%s', falling back to %s.", label, kind, name, fallback
             )
         return None
 
-    def load_header_params(self):
-        if self.header is not None:
-            hptr = None
-            headername = self.check_ext(self.header.lower(), ".txt")
-            pp = PurePath(headername)
-            if Path(pp).is_file():  # external header file
-                hptr = self.abs_path(pp).read_bytes()
-            else:  # check if header is a package resource
-                hptr = self.get_resource_data("headers", headername)
-            if hptr is not None:
-                logger.info("Header: '%s' (parameter)" % headername)
-                return hptr
-            logger.warning(
-                "Invalid header parameter '%s', falling back to template header."
-                % headername
-            )
-        return None
+    def read_resource(self, group, name, local=False):
+        if local:
+            try:  # external file
+                return self.abs_path(PurePath(name)).read_bytes()
+            except (OSError, ValueError, RuntimeError) as e:
+                if not _not_a_file(e):
+                    raise
+                # check if it is a package resource
+        return self.get_resource_data(group, name)
 
-    def load_style(self):
-        sptr = self.load_style_params()
-        if sptr is None:
-            sptr = self.load_style_template()
-        if sptr is None:
-            sptr = self.load_style_default()
-        if sptr is None:
-            raise IOError(ENOENT, "Invalid default fallback style '%s'." % def_style)
-        return yaml.load(sptr)
-
-    def load_style_default(self):
-        sptr = self.get_resource_data("styles", def_style)
-        if sptr is not None:
-            if isinstance(yaml.load(sptr), ReadMeStyle):
-                logger.info("Style: '%s' (default)," % def_style)
-                return sptr
-        return None
-
-    def load_style_template(self):
-        stylename = self.check_ext(
-            self.get_template_attr(self._doc_template, "style").lower(), ".yaml"
-        )
-        sptr = self.get_resource_data("styles", stylename)
+    @staticmethod
+    def parse_style(sptr):
+        # parse style yaml, None unless it is a valid readme style
         if sptr is not None:
-            if isinstance(yaml.load(sptr), ReadMeStyle):
-                logger.info("Style: '%s' (template)" % stylename)
-                return sptr
-        logger.warning(
-            "Invalid style template '%s', falling back to default '%s' style."
-            % (stylename, def_style)
-        )
-        return None
-
-    def load_style_params(self):
-        if self.style is not None:
-            sptr = None
-            stylename = self.check_ext(self.style.lower(), ".yaml")
-            pp = PurePath(stylename)
-            if Path(pp).is_file():  # external style file
-                sptr = self.abs_path(pp)
-            else:  # check if style is a package resource
-                sptr = self.get_resource_data("styles", stylename)
-            if sptr is not None:
-                if isinstance(yaml.load(sptr), ReadMeStyle):
-                    logger.info("Style: '%s' (parameter)" % stylename)
-                    return sptr
-            logger.warning(
-                "Invalid style parameter '%s', falling back to template style."
-                % stylename
-            )
+            try:
+                style = style_yaml.load(sptr)
+            except ConstructorError:  # unknown tag, e.g. a mistyped !ReadMeStyle
+                return None
+            if isinstance(style, ReadMeStyle):
+                return style
         return None
 
     def set_yaml_path(self):
-        if self.yamlfile is not None:
-            yf = self.check_ext(self.yamlfile, ".yaml")
-            pp = PurePath(yf)
-            if Path(pp).is_file():
-                self.yaml_path = self.abs_path(pp)
-        else:
+        if self.yamlfile is None:
             raise IOError(ENOENT, "Missing file", self.yamlfile)
-        if self.yaml_path is None:
+        yf = self.check_ext(self.yamlfile, ".yaml")
+        # plain string probe, only build the path object for a real file
+        if not os.path.isfile(yf):
             raise IOError(ENOENT, "Invalid file", yf)
-        else:
-            logger.info("Input: '%s'" % self.yaml_path)
+        self.yaml_path = self.abs_path(PurePath(yf))
+        logger.info("Input: '%s'", self.yaml_path)
 
     def set_readme_path(self):
-        pp = None
-        ppy = PurePath(self.yaml_path)
+        ppy = self.yaml_path  # already an absolute path (set_yaml_path)
+        rst = None  # stat of the readme path, when already known
         if self.output is not None:
             ppo = PurePath(self.output)
-        if self.filename is not None:
-            ppf = PurePath(self.filename)
-        # output and filename params
-        if self.output is not None and self.filename is not None:
-            if Path(ppo).is_file():
-                logger.warning("'%s' is a file, using parent directory" % self.output)
-                pp = PurePath.joinpath(ppo.parent, ppf)
-            else:
-                pp = PurePath.joinpath(ppo, ppf)
-        # output param only
-        elif self.output is not None and self.filename is None:
-            if Path(ppo).is_dir():
-                pp = PurePath.joinpath(ppo, ppy.stem + ".txt")
-            else:
-                if ppo.suffix == ".txt":  # if .txt suffix treat as output file
-                    pp = PurePath(self.check_ext(self.output, ".txt"))
+            # one stat tells file, directory or missing apart
+            ost = _stat_or_none(self.output)
+            # output and filename params
+            if self.filename is not None:
+                if ost is not None and S_ISREG(ost.st_mode):
+                    logger.warning(
+                        "'%s' is a file, using parent directory", self.output
+                    )
+                    pp = ppo.parent / self.filename
                 else:
-                    pp = PurePath.joinpath(ppo, ppy.stem + ".txt")
+                    pp = ppo / self.filename
+            # output param only
+            elif ost is not None and S_ISDIR(ost.st_mode):
+                pp = ppo / (ppy.stem + ".txt")
+            elif ppo.suffix == ".txt":  # if .txt suffix treat as output file
+                pp = ppo
+                rst = ost
+            else:
+                pp = ppo / (ppy.stem + ".txt")
         # filename param only
-        elif self.output is None and self.filename is not None:
-            pp = PurePath.joinpath(ppy.parent, ppf)
+        elif self.filename is not None:
+            pp = ppy.parent / self.filename
         # no additional params
         else:
-            pp = PurePath.joinpath(ppy.parent, ppy.stem + ".txt")
+            pp = ppy.parent / (ppy.stem + ".txt")
         # assign and validate output
         self.readme_path = self.abs_path(pp)
-        if not self.readme_path.parent.exists():
-            Path.mkdir(self.readme_path.parent, parents=True)
-        if self.readme_path.exists():
-            logger.warning("Existing file '%s' will be overwritten." % self.readme_path)
-        logger.info("Output: '%s'" % self.readme_path)
+        self.readme_path.parent.mkdir(parents=True, exist_ok=True)
+        if rst is None:
+            rst = _stat_or_none(self.readme_path)
+        if rst is not None:
+            logger.warning("Existing file '%s' will be overwritten.", self.readme_path)
+        logger.info("Output: '%s'", self.readme_path)
 
     def start_proclog(self):
-        ht = "..:: " + app_name + " LOG ::.."
-        hl = (80 - len(ht)) + len(ht)  # 80 chars (terminal width)
-        logger.info("".join([char * hl for char in "~"]))
-        logger.info(ht.center(hl))
-        logger.info("".join([char * hl for char in "~"]))
-        logger.info("Created: %s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        logger.info("Parameters: %s" % self.__str__())
+        logger.info(log_banner)
+        logger.info(log_title)
+        logger.info(log_banner)
+        logger.info("Created: %s", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        logger.info("Parameters: %s", self)
 
     def conf_proclog(self):
         # The output directory and log file name will be the same as the readme file.
         # To determine this, the input parameters: yamlfile, output, and filename, need
-        # to be processed. Because this occurs before the log file exists, log to a
-        # tempfile. Once known, copy log contents, update log handler and kill tempfile.
-        with temp_filename(".log") as tf:
-            # create logging filehandler with tempfile
-            fhndl = logging.FileHandler(tf)
-            fhndl.name = __package__ + "_file"
-            fhndl.setLevel(self.log_verbosity)
-            fhndl.setFormatter(ProcLogFileFormatter())
-            logger.addHandler(fhndl)
+        # to be processed. Because this occurs before the log file exists, buffer the
+        # log records in memory. Once known, open the log file and flush them into it.
+        mhndl = MemoryHandler(capacity=1024, flushLevel=logging.CRITICAL + 1)
+        mhndl.setLevel(self.log_verbosity)
+        logger.addHandler(mhndl)
+        try:
             # start process log
             self.start_proclog()
             # process input/output paths
             self.set_yaml_path()
             self.set_readme_path()
-            # copy temp log and update handler
-            readme_log = self.readme_path.with_suffix(".log")
-            fhndl.close()
-            shutil.copy2(tf, readme_log)
-            fhndl.baseFilename = readme_log
+            # create logging filehandler and hand over the buffered records
+            fhndl = logging.FileHandler(self.readme_path.with_suffix(".log"), "w")
+            fhndl.name = __package__ + "_file"
+            fhndl.setLevel(self.log_verbosity)
+            fhndl.setFormatter(ProcLogFileFormatter())
+            mhndl.setTarget(fhndl)
+            mhndl.flush()
+            logger.addHandler(fhndl)
+        finally:
+            logger.removeHandler(mhndl)
+            mhndl.close()
 
     def create_readme(self):
         try:
             # load default style (for fallbacks)
-            self._def_style = yaml.load(self.get_resource_data("styles", def_style))
+            self._def_style = style_yaml.load(
+                self.get_resource_data("styles", def_style)
+            )
+            # fallback header name, used throughout the header fallback chain
+            self._default_header_name = _norm(
+                self.get_default_attr(self._def_style, "header"), ".txt"
+            )
             # prepare input parameters
             if self.log_to_file:
                 self.conf_proclog()
@@ -998,26 +1080,25 @@ class ReadMe(object):
                 if handler.get_name() == __package__ + "_file":
                     handler.close()
 
-    def __repr__(self):
-        return (
-            "%s(yamlfile=%r, output=%r, filename=%r, header=%r, style=%r, log=%r)"
-            % (
-                self.__class__.__name__,
+    # parameter labels shared by repr/str, see _params
+    _param_names = ("yamlfile", "output", "filename", "header", "style", "log")
+
+    def _params(self):
+        return zip(
+            self._param_names,
+            (
                 self.yamlfile,
                 self.output,
                 self.filename,
                 self.header,
                 self.style,
                 self.log_to_file,
-            )
+            ),
         )
 
+    def __repr__(self):
+        args = ", ".join("%s=%r" % p for p in self._params())
+        return "%s(%s)" % (self.__class__.__name__, args)
+
     def __str__(self):
-        return "yamlfile=%s, output=%s, filename=%s, header=%s, style=%s, log=%s" % (
-            self.yamlfile,
-            self.output,
-            self.filename,
-            self.header,
-            self.style,
-            self.log_to_file,
-        )
+        return ", ".join("%s=%s" % p for p in self._params())
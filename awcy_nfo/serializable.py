@@ -1,6 +1,11 @@
+import sys
+
+from dataclasses import dataclass
 from ruamel.yaml import YAML, yaml_object
 
 yaml = YAML()
+# styles are read-only inputs: no round-trip data needed, use the (C) safe loader
+style_yaml = YAML(typ="safe")
 
 
 @yaml_object(yaml)
@@ -14,13 +19,17 @@ class Section:
 
     @classmethod
     def to_yaml(cls, representer, node):
-        return representer.represent_scalar(
-            cls.yaml_tag, u"{.name}~{.alignment}~{.spacing}".format(node, node, node)
-        )
+        # default spacing is implied (see from_yaml), only emit it if it differs
+        value = f"{node.name}~{node.alignment}"
+        if node.spacing != "double":
+            value = f"{value}~{node.spacing}"
+        return representer.represent_scalar(cls.yaml_tag, value)
 
     @classmethod
     def from_yaml(cls, constructor, node):
-        return cls(*node.value.split("~"))
+        name, *layout = node.value.split("~", 2)
+        # intern names, they are repeatedly compared against section lookups
+        return cls(sys.intern(name), *layout)
 
 
 @yaml_object(yaml)
@@ -32,71 +41,48 @@ class Subsection:
 
     @classmethod
     def to_yaml(cls, representer, node):
-        return representer.represent_scalar(cls.yaml_tag, u"{.name}".format(node))
+        return representer.represent_scalar(cls.yaml_tag, f"{node.name}")
 
     @classmethod
     def from_yaml(cls, constructor, node):
         return cls(node.value)
 
 
-class ReadMeStyle(object):
-    def __init__(
-        self,
-        header,
-        header_alignment,
-        subheader,
-        line_buffer,
-        line_length,
-        line_div_char,
-        line_div_percent,
-        line_div_alignment,
-        line_start_char,
-        line_end_char,
-        section_pre,
-        section_post,
-        section_alignment,
-        subsection_pre,
-        subsection_post,
-        subsection_alignment,
-        credits_primary_thx,
-        credits_secondary_thx,
-        credits_additional_thx,
-        credits_team_thx,
-        credits_pre,
-        credits_post,
-        credits_offset,
-        footer,
-        footer_alignment,
-        subfooter,
-        contact_us,
-    ):
-        self.header = header
-        self.header_alignment = header_alignment
-        self.subheader = subheader
-        self.line_buffer = line_buffer
-        self.line_length = line_length
-        self.line_div_char = line_div_char
-        self.line_div_percent = line_div_percent
-        self.line_div_alignment = line_div_alignment
-        self.line_start_char = line_start_char
-        self.line_end_char = line_end_char
-        self.section_pre = section_pre
-        self.section_post = section_post
-        self.section_alignment = section_alignment
-        self.subsection_pre = subsection_pre
-        self.subsection_post = subsection_post
-        self.subsection_alignment = subsection_alignment
-        self.credits_primary_thx = credits_primary_thx
-        self.credits_secondary_thx = credits_secondary_thx
-        self.credits_additional_thx = credits_additional_thx
-        self.credits_team_thx = credits_team_thx
-        self.credits_pre = credits_pre
-        self.credits_post = credits_post
-        self.credits_offset = credits_offset
-        self.footer = footer
-        self.footer_alignment = footer_alignment
-        self.subfooter = subfooter
-        self.contact_us = contact_us
+# plain data holder, fields are set by the yaml constructor. partial styles
+# leave some unset, so keep identity eq and the default repr (both safe then)
+@dataclass(eq=False, repr=False)
+class ReadMeStyle:
+    header: str
+    header_alignment: str
+    subheader: str
+    line_buffer: int
+    line_length: int
+    line_div_char: str
+    line_div_percent: int
+    line_div_alignment: str
+    line_start_char: str
+    line_end_char: str
+    section_pre: str
+    section_post: str
+    section_alignment: str
+    subsection_pre: str
+    subsection_post: str
+    subsection_alignment: str
+    credits_primary_thx: str
+    credits_secondary_thx: str
+    credits_additional_thx: str
+    credits_team_thx: str
+    credits_pre: str
+    credits_post: str
+    credits_offset: int
+    footer: str
+    footer_alignment: str
+    subfooter: str
+    contact_us: str
 
 
 yaml.register_class(ReadMeStyle)
+# section tags too, so a template passed as a style loads (and is rejected)
+style_yaml.register_class(Section)
+style_yaml.register_class(Subsection)
+style_yaml.register_class(ReadMeStyle)
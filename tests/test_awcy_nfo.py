@@ -1,5 +1,62 @@
-from awcy_nfo import __version__
+import io
+import os
+import errno
+
+from pathlib import PurePath
+from unittest import mock
+
+from awcy_nfo import __version__, ReadMe
+from awcy_nfo.helpers import _fast_copy
+from awcy_nfo.serializable import yaml, Section, ReadMeStyle
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_split_keep():
+    assert ReadMe.split_keep("", " ") == [""]
+    assert ReadMe.split_keep("a b  c", " ") == ["a ", "b ", " ", "c"]
+    assert ReadMe.split_keep("a, b,", ",") == ["a,", " b,", ""]
+    # previously failed for strings containing the highest code point
+    assert ReadMe.split_keep("a \U0010ffff", " ") == ["a ", "\U0010ffff"]
+
+
+def test_abs_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert ReadMe.abs_path(PurePath("readme.txt")) == tmp_path.resolve() / "readme.txt"
+    assert ReadMe.abs_path(PurePath(tmp_path)) == tmp_path
+
+
+def test_flatten_mapping():
+    mappings = [{"title": None}, {"title": "a", "version": 1}, {"title": "b"}]
+    flat = ReadMe.flatten_mapping(mappings)
+    assert flat == {"title": "a", "version": 1}
+    assert flat["title"] == ReadMe.get_yaml_mapping(mappings, "title")
+
+
+def test_section_round_trip():
+    buf = io.StringIO()
+    yaml.dump([Section("A", "left"), Section("B", "center", "single")], buf)
+    assert buf.getvalue() == "- !section A~left\n- !section B~center~single\n"
+    a, b = yaml.load(buf.getvalue())
+    assert (a.name, a.alignment, a.spacing) == ("A", "left", "double")
+    assert (b.name, b.alignment, b.spacing) == ("B", "center", "single")
+
+
+def test_fast_copy_fallback(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"awcy" * 1000)
+    # unsupported on the first call: an error, or silently copying nothing
+    for effect in (OSError(errno.EOPNOTSUPP, "unsupported"), [0]):
+        with mock.patch.object(os, "copy_file_range", side_effect=effect, create=True):
+            _fast_copy(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+
+def test_parse_style_mistagged():
+    style = ReadMe.get_resource_data("styles", "classic.yaml")
+    assert isinstance(ReadMe.parse_style(style), ReadMeStyle)
+    # unknown tags are an invalid style (fall back), not a load error
+    for tag in (b"!ReadmeStyle", b"!Foo"):
+        assert ReadMe.parse_style(style.replace(b"!ReadMeStyle", tag)) is None